@@ -383,7 +383,10 @@ class GConsole(wx.EvtHandler):
 
         self._guiparent = guiparent
         self._giface = giface
-        self._ignoredCmdPattern = ignoredCmdPattern
+        # compile the pattern once, it is matched for each command run
+        self._ignoredCmdPattern = (
+            re.compile(ignoredCmdPattern) if ignoredCmdPattern else None
+        )
 
         # create queues
         self.requestQ = Queue.Queue()
@@ -491,15 +494,17 @@ class GConsole(wx.EvtHandler):
             Debug.msg(2, "GPrompt:RunCmd(): empty command")
             return
 
+        cmdString = " ".join(command)
+
         # update history file
-        self.UpdateHistoryFile(" ".join(command))
+        self.UpdateHistoryFile(cmdString)
 
         if command[0] in globalvar.grassCmd:
             # send GRASS command without arguments to GUI command interface
             # except ignored commands (event is emitted)
             if (
                 self._ignoredCmdPattern
-                and re.compile(self._ignoredCmdPattern).search(" ".join(command))
+                and self._ignoredCmdPattern.search(cmdString)
                 and "--help" not in command
                 and "--ui" not in command
             ):
@@ -534,7 +539,7 @@ class GConsole(wx.EvtHandler):
                                     "Option <%(opt)s>: read from standard input is not "
                                     "supported by wxGUI"
                                 )
-                                % {"cmd": " ".join(command), "opt": p.get("name", "")},
+                                % {"cmd": cmdString, "opt": p.get("name", "")},
                             )
                             return
 
@@ -610,9 +615,7 @@ class GConsole(wx.EvtHandler):
             # of the script)
 
             # check if we ignore the command (similar to grass commands part)
-            if self._ignoredCmdPattern and re.compile(self._ignoredCmdPattern).search(
-                " ".join(command)
-            ):
+            if self._ignoredCmdPattern and self._ignoredCmdPattern.search(cmdString):
                 event = gIgnoredCmdRun(cmd=command)
                 wx.PostEvent(self, event)
                 return
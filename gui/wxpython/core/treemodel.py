@@ -16,7 +16,6 @@ This program is free software under the GNU General Public License
 @author Anna Petrasova <kratochanna gmail.com>
 """
 import six
-import copy
 
 from grass.script.utils import naturally_sort
 
@@ -61,6 +60,18 @@ class TreeModel(object):
       node21
         * label : node21
         * xxx : 1
+    >>> filtered = tree.Filtered(key='xxx', value=1)
+    >>> print(filtered)
+    node1
+      * label : node1
+      node11
+        * label : node11
+        * xxx : 1
+    node2
+      * label : node2
+      node21
+        * label : node21
+        * xxx : 1
 
     """
 
@@ -92,11 +103,20 @@ class TreeModel(object):
         node.parent = parent
         return node
 
-    def SearchNodes(self, parent=None, **kwargs):
-        """Search nodes according to specified attributes."""
+    def SearchNodes(self, parent=None, recursive=True, **kwargs):
+        """Search nodes according to specified attributes.
+
+        :param parent: node whose subtree is searched (root by default)
+        :param recursive: if False, search only direct children of parent
+        """
         nodes = []
         parent = parent if parent else self.root
-        self._searchNodes(node=parent, foundNodes=nodes, **kwargs)
+        if recursive:
+            self._searchNodes(node=parent, foundNodes=nodes, **kwargs)
+        else:
+            for child in parent.children:
+                if child.match(**kwargs):
+                    nodes.append(child)
         return nodes
 
     def _searchNodes(self, node, foundNodes, **kwargs):
@@ -153,35 +173,56 @@ class TreeModel(object):
         if node.children:
             naturally_sort(node.children, key=lambda node: node.label)
 
+    def CloneStructure(self):
+        """Returns a copy of the tree which shares the node data.
+
+        New node objects are created for the structure of the tree,
+        but the data dictionaries are shared between the original and
+        the cloned nodes, so cloning is cheap compared to a deep copy.
+        """
+        clone = TreeModel(self.nodeClass)
+        self._cloneNode(source=self.root, target=clone.root)
+        return clone
+
+    def _cloneNode(self, source, target):
+        """Helper method for cloning tree structure."""
+        for child in source.children:
+            node = child.clone()
+            node.parent = target
+            target.children.append(node)
+            self._cloneNode(source=child, target=node)
+
     def Filtered(self, **kwargs):
         """Filters model based on parameters in kwargs
         that are passed to node's match function.
-        Copies tree and returns a filtered copy."""
-
-        def _filter(node):
-            if node.children:
-                to_remove = []
-                for child in node.children:
-                    match = _filter(child)
-                    if not match:
-                        to_remove.append(child)
-                for child in reversed(to_remove):
-                    fmodel.RemoveNode(child)
-                if node.children:
-                    return True
-            return node.match(**kwargs)
+        Returns a new model with the matching nodes,
+        the node data are shared with this model."""
+
+        def _filter(source, target):
+            for child in source.children:
+                node = child.clone()
+                _filter(child, node)
+                if node.children or child.match(**kwargs):
+                    node.parent = target
+                    target.children.append(node)
 
-        fmodel = copy.deepcopy(self)
-        _filter(fmodel.root)
+        fmodel = TreeModel(self.nodeClass)
+        _filter(self.root, fmodel.root)
 
         return fmodel
 
-    def GetLeafCount(self, node):
-        """Returns the number of leaves in a node."""
+    def GetLeafCount(self, node, limit=None):
+        """Returns the number of leaves in a node.
+
+        :param limit: stop counting above this number of leaves
+                      (the result is then only guaranteed to exceed limit)
+        """
         if node.children:
             count = 0
             for child in node.children:
-                count += self.GetLeafCount(child)
+                count += self.GetLeafCount(child, limit=limit)
+                if limit is not None and count > limit:
+                    return count
             return count
         return 1
 
@@ -216,6 +257,11 @@ class DictNode(object):
     def children(self):
         return self._children
 
+    def clone(self):
+        """Returns a copy of the node without children
+        which shares the data dictionary."""
+        return self.__class__(data=self.data)
+
     def nprint(self, text, indent=0):
         text.append(indent * " " + self.label)
         if self.data:
@@ -248,11 +294,18 @@ class ModuleNode(DictNode):
         self._label = label if label else ""
         if not data:
             self.data = {}
+        # lowercased data values cached for case-insensitive matching
+        self._lowered = {}
 
     @property
     def label(self):
         return self._label
 
+    def clone(self):
+        """Returns a copy of the node without children
+        which shares the data dictionary."""
+        return self.__class__(label=self._label, data=self.data)
+
     def match(self, key, value, case_sensitive=False):
         """Method used for searching according to command,
         keywords or description."""
@@ -263,6 +316,9 @@ class ModuleNode(DictNode):
         else:
             keys = key
 
+        if not case_sensitive:
+            value = value.lower()
+
         for key in keys:
             if key not in ("command", "keywords", "description"):
                 return False
@@ -279,7 +335,12 @@ class ModuleNode(DictNode):
             else:
                 # this works fully only for English and requires accents
                 # to be exact match (even Python 3 casefold() does not help)
-                if value.lower() in text.lower() or value == "*":
+                try:
+                    text = self._lowered[key]
+                except KeyError:
+                    text = text.lower()
+                    self._lowered[key] = text
+                if value in text or value == "*":
                     return True
         return False
 
@@ -85,6 +85,14 @@ class DataCatalog(wx.Panel):
         # some layout
         self._layout()
 
+        # defer loading tree items until the panel is actually shown;
+        # a show event is delivered only when the panel itself is shown
+        # (notebook page), the idle handler covers the panel becoming
+        # visible with its parent (standalone frame)
+        self._pendingLoad = False
+        self.Bind(wx.EVT_SHOW, self._onShow)
+        self.Bind(wx.EVT_IDLE, self._onIdle)
+
         # show infobar for first-time user if applicable
         if is_first_time_user():
             # show data structure infobar for first-time user
@@ -130,10 +138,30 @@ class DataCatalog(wx.Panel):
         )
 
     def LoadItems(self):
-        """Reload tree - full or lazy - based on user settings"""
+        """Reload tree - full or lazy - based on user settings.
+
+        If the panel is not visible yet (e.g. hidden in a notebook),
+        loading is postponed until the panel is shown for the first time."""
+        if not self.IsShownOnScreen():
+            self._pendingLoad = True
+            return
+        self._pendingLoad = False
         self._startLoadingTime = clock()
         self.tree.ReloadTreeItems(full=False)
 
+    def _onShow(self, event):
+        """Load tree items postponed while the panel was hidden"""
+        if event.IsShown() and self._pendingLoad:
+            wx.CallAfter(self.LoadItems)
+        event.Skip()
+
+    def _onIdle(self, event):
+        """Load postponed tree items once the panel became visible
+        together with its parent window"""
+        if self._pendingLoad and self.IsShownOnScreen():
+            self.LoadItems()
+        event.Skip()
+
     def _loadingDone(self):
         """If loading took more time, suggest lazy loading"""
         if clock() - self._startLoadingTime > 5 and not self.tree._useLazyLoading():
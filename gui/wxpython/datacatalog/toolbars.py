@@ -67,15 +67,15 @@ class DataCatalogToolbar(BaseToolbar):
         self.filter.SetDescriptiveText(_("Search"))
         self.filter.ShowCancelButton(True)
         self.filter.SetSize((150, self.filter.GetBestSize()[1]))
+        # filter only after the user pauses typing,
+        # filtering walks the whole tree on each pass
+        self.filterTimer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.OnFilterTimer, self.filterTimer)
         self.filter.Bind(
             wx.EVT_TEXT,
-            lambda event: self.parent.Filter(
-                self.filter.GetValue(), self.filter_element
-            ),
-        )
-        self.filter.Bind(
-            wx.EVT_SEARCHCTRL_CANCEL_BTN, lambda evt: self.parent.Filter("")
+            lambda event: self.filterTimer.Start(150, wx.TIMER_ONE_SHOT),
         )
+        self.filter.Bind(wx.EVT_SEARCHCTRL_CANCEL_BTN, self.OnFilterClear)
         self.AddControl(self.filter)
         filterMenu = wx.Menu()
         item = filterMenu.AppendRadioItem(-1, "All")
@@ -122,6 +122,17 @@ class DataCatalogToolbar(BaseToolbar):
             )
         )
 
+    def OnFilterTimer(self, event):
+        """Filter tree after typing paused"""
+        self.parent.Filter(self.filter.GetValue(), self.filter_element)
+
+    def OnFilterClear(self, event):
+        """Clear the filter, stopping any filtering still pending
+        in the timer so that it does not reapply the stale text"""
+        self.filterTimer.Stop()
+        self.filter.ChangeValue("")
+        self.parent.Filter("")
+
     def OnFilterMenu(self, event):
         """Decide the element to filter by"""
         filterMenu = self.filter.GetMenu().GetMenuItems()
@@ -20,7 +20,6 @@ for details.
 """
 import os
 import re
-import copy
 from multiprocessing import Process, Queue, cpu_count
 
 watchdog_used = True
@@ -240,22 +239,22 @@ class DataCatalogNode(DictNode):
     @property
     def label(self):
         data = self.data
-        if data["type"] == "mapset":
-            owner = data["owner"] if data["owner"] else _("name unknown")
-            if data["current"]:
-                return _("{name}  (current)").format(**data)
-            elif data["is_different_owner"] and data["lock"]:
-                return _("{name}  (in use, owner: {owner})").format(
-                    name=data["name"], owner=owner
-                )
-            elif data["lock"]:
-                return _("{name}  (in use)").format(**data)
-            elif data["is_different_owner"]:
-                return _("{name}  (owner: {owner})").format(
-                    name=data["name"], owner=owner
-                )
+        if data["type"] != "mapset":
+            return data["name"]
+
+        owner = data["owner"] if data["owner"] else _("name unknown")
+        if data["current"]:
+            return _("{name}  (current)").format(**data)
+        elif data["is_different_owner"] and data["lock"]:
+            return _("{name}  (in use, owner: {owner})").format(
+                name=data["name"], owner=owner
+            )
+        elif data["lock"]:
+            return _("{name}  (in use)").format(**data)
+        elif data["is_different_owner"]:
+            return _("{name}  (owner: {owner})").format(name=data["name"], owner=owner)
 
-        return _("{name}").format(**data)
+        return data["name"]
 
     def match(self, method="exact", **kwargs):
         """Method used for searching according to given parameters.
@@ -267,24 +266,21 @@ class DataCatalogNode(DictNode):
         if not kwargs:
             return False
 
+        data = self.data
         if method == "exact":
             for key, value in kwargs.items():
-                if not (key in self.data and self.data[key] == value):
+                if data.get(key) != value:
                     return False
             return True
         # for filtering
-        if (
-            "type" in kwargs
-            and "type" in self.data
-            and kwargs["type"] != self.data["type"]
-        ):
-            return False
-        if (
-            "name" in kwargs
-            and "name" in self.data
-            and not kwargs["name"].search(self.data["name"])
-        ):
-            return False
+        if "type" in kwargs:
+            node_type = data.get("type")
+            if node_type is not None and kwargs["type"] != node_type:
+                return False
+        if "name" in kwargs:
+            name = data.get("name")
+            if name is not None and not kwargs["name"].search(name):
+                return False
         return True
 
 
@@ -387,7 +383,10 @@ class DataCatalogTree(TreeView):
             EVT_UPDATE_MAPSET, lambda evt: self._onWatchdogMapsetReload(evt.src_path)
         )
         self.Bind(wx.EVT_IDLE, self._onUpdateMapsetWhenIdle)
+        self.Bind(wx.EVT_TREE_ITEM_EXPANDING, self._onItemExpanding)
         self.observer = None
+        # confirmation dialog created on first use and reused afterwards
+        self._confirmDlg = None
 
     def _resetSelectVariables(self):
         """Reset variables related to item selection."""
@@ -478,7 +477,7 @@ class DataCatalogTree(TreeView):
         p.start()
         maps, error = q.get()
         self._populateMapsetItem(mapset_node, maps[mapset_node.data["name"]])
-        self._orig_model = copy.deepcopy(self._model)
+        self._orig_model = self._model.CloneStructure()
         return error
 
     def _reloadLocationNode(self, location_node):
@@ -517,7 +516,7 @@ class DataCatalogTree(TreeView):
             )
             self._populateMapsetItem(mapset_node, maps[mapset])
         self._model.SortChildren(location_node)
-        self._orig_model = copy.deepcopy(self._model)
+        self._orig_model = self._model.CloneStructure()
         return error
 
     def _lazyReloadGrassDBNode(self, grassdb_node):
@@ -564,7 +563,7 @@ class DataCatalogTree(TreeView):
         for node in all_location_nodes:
             self._model.SortChildren(node)
         self._model.SortChildren(grassdb_node)
-        self._orig_model = copy.deepcopy(self._model)
+        self._orig_model = self._model.CloneStructure()
         return errors
 
     def _reloadGrassDBNode(self, grassdb_node):
@@ -654,7 +653,7 @@ class DataCatalogTree(TreeView):
         for node in all_location_nodes:
             self._model.SortChildren(node)
         self._model.SortChildren(grassdb_node)
-        self._orig_model = copy.deepcopy(self._model)
+        self._orig_model = self._model.CloneStructure()
         return errors
 
     def _reloadTreeItems(self, full=False):
@@ -667,7 +666,9 @@ class DataCatalogTree(TreeView):
         """
         errors = []
         for grassdatabase in self.grassdatabases:
-            grassdb_nodes = self._model.SearchNodes(name=grassdatabase, type="grassdb")
+            grassdb_nodes = self._model.SearchNodes(
+                name=grassdatabase, type="grassdb", recursive=False
+            )
             if not grassdb_nodes:
                 grassdb_node = self._model.AppendNode(
                     parent=self._model.root,
@@ -758,24 +759,32 @@ class DataCatalogTree(TreeView):
 
     def GetDbNode(self, grassdb, location=None, mapset=None, map=None, map_type=None):
         """Returns node representing db/location/mapset/map or None if not found."""
-        grassdb_nodes = self._model.SearchNodes(name=grassdb, type="grassdb")
+        grassdb_nodes = self._model.SearchNodes(
+            name=grassdb, type="grassdb", recursive=False
+        )
         if grassdb_nodes:
             if not location:
                 return grassdb_nodes[0]
             location_nodes = self._model.SearchNodes(
-                parent=grassdb_nodes[0], name=location, type="location"
+                parent=grassdb_nodes[0], name=location, type="location", recursive=False
             )
             if location_nodes:
                 if not mapset:
                     return location_nodes[0]
                 mapset_nodes = self._model.SearchNodes(
-                    parent=location_nodes[0], name=mapset, type="mapset"
+                    parent=location_nodes[0],
+                    name=mapset,
+                    type="mapset",
+                    recursive=False,
                 )
                 if mapset_nodes:
                     if not map:
                         return mapset_nodes[0]
                     map_nodes = self._model.SearchNodes(
-                        parent=mapset_nodes[0], name=map, type=map_type
+                        parent=mapset_nodes[0],
+                        name=map,
+                        type=map_type,
+                        recursive=False,
                     )
                     if map_nodes:
                         return map_nodes[0]
@@ -838,8 +847,9 @@ class DataCatalogTree(TreeView):
                 self._model.AppendNode(
                     parent=grassdb_node, data=dict(type="location", name=location)
                 )
-            self.RefreshItems()
-            if grassdatabase == gisenv["GISDBASE"]:
+        self.RefreshItems()
+        for grassdb_node in self._model.root.children:
+            if grassdb_node.data["name"] == gisenv["GISDBASE"]:
                 self.ExpandNode(grassdb_node, recursive=False)
 
     def _loadItemsDone(self, event):
@@ -870,6 +880,8 @@ class DataCatalogTree(TreeView):
         for item in data:
             self._model.AppendNode(parent=mapset_node, data=dict(**item))
         self._model.SortChildren(mapset_node)
+        # distinguishes an empty mapset from a mapset not loaded yet
+        mapset_node.data["is_loaded"] = True
 
     def _initImages(self):
         bmpsize = (16, 16)
@@ -885,6 +897,8 @@ class DataCatalogTree(TreeView):
         for each in self._iconTypes:
             il.Add(icons[each])
         self.AssignImageList(il)
+        # precomputed mapping of node type to image index used when painting
+        self._iconIndex = {each: index for index, each in enumerate(self._iconTypes)}
 
     def GetControl(self):
         """Returns control itself."""
@@ -1018,6 +1032,32 @@ class DataCatalogTree(TreeView):
             else:
                 self.ExpandNode(node, recursive=False)
 
+    def _onItemExpanding(self, event):
+        """Load maps of a mapset when expanding its node for the first time.
+
+        With lazy loading enabled, mapset nodes are created without
+        children and their maps are loaded only when the user opens
+        the mapset node. Needs to call event.Skip() in all cases so
+        that the tree itself creates the child items afterwards.
+
+        Does nothing while a filter is active (the displayed model is
+        a filtered clone then); reloading a mapset node would replace
+        the backed up unfiltered model with the filtered subset and
+        Filter() auto-expands small results, which would trigger a
+        blocking load for every unloaded mapset in them."""
+        item = event.GetItem()
+        if item.IsOk():
+            node = self._model.GetNodeByIndex(self.GetIndexOfItem(item))
+            if (
+                node.data["type"] == "mapset"
+                and not node.data.get("is_loaded")
+                and self._model is self._orig_model
+                and self._useLazyLoading()
+            ):
+                self._reloadMapsetNode(node)
+                self.RefreshNode(node, recursive=True)
+        event.Skip()
+
     def ExpandCurrentLocation(self):
         """Expand current location"""
         location = gscript.gisenv()["LOCATION_NAME"]
@@ -1035,31 +1075,48 @@ class DataCatalogTree(TreeView):
         location = genv["LOCATION_NAME"]
         mapset = genv["MAPSET"]
 
-        grassdbItem = self._model.SearchNodes(name=gisdbase, type="grassdb")
+        grassdbItem = self._model.SearchNodes(
+            name=gisdbase, type="grassdb", recursive=False
+        )
         if not grassdbItem:
             return None, None, None
 
         locationItem = self._model.SearchNodes(
-            parent=grassdbItem[0], name=location, type="location"
+            parent=grassdbItem[0], name=location, type="location", recursive=False
         )
         if not locationItem:
             return grassdbItem[0], None, None
 
         mapsetItem = self._model.SearchNodes(
-            parent=locationItem[0], name=mapset, type="mapset"
+            parent=locationItem[0], name=mapset, type="mapset", recursive=False
         )
         if not mapsetItem:
             return grassdbItem[0], locationItem[0], None
 
         return grassdbItem[0], locationItem[0], mapsetItem[0]
 
+    def OnGetChildrenCount(self, index):
+        """Overridden method to return the number of child items.
+
+        Reports a placeholder child for mapsets which were not loaded
+        yet, so that they get an expander button although their maps
+        are loaded only on expansion (_onItemExpanding). Not done while
+        a filter is active since expanding must not load maps then."""
+        node = self._model.GetNodeByIndex(index)
+        if (
+            not node.children
+            and node.data.get("type") == "mapset"
+            and not node.data.get("is_loaded")
+            and self._model is self._orig_model
+            and self._useLazyLoading()
+        ):
+            return 1
+        return len(node.children)
+
     def OnGetItemImage(self, index, which=wx.TreeItemIcon_Normal, column=0):
         """Overridden method to return image for each item."""
         node = self._model.GetNodeByIndex(index)
-        try:
-            return self._iconTypes.index(node.data["type"])
-        except ValueError:
-            return 0
+        return self._iconIndex.get(node.data["type"], 0)
 
     def OnGetItemTextColour(self, index):
         """Overridden method to return colour for each item.
@@ -1448,10 +1505,7 @@ class DataCatalogTree(TreeView):
                     node = "raster_3d"
                 if pasted == 0:
                     Debug.msg(1, "COPIED TO: " + new_name)
-                    if self.copy_mode:
-                        self.showNotification.emit(message=_("g.copy completed"))
-                    else:
-                        self.showNotification.emit(message=_("g.copy completed"))
+                    self.showNotification.emit(message=_("g.copy completed"))
                     self._giface.grassdbChanged.emit(
                         grassdb=self.selected_grassdb[0].data["name"],
                         location=self.selected_location[0].data["name"],
@@ -1603,7 +1657,9 @@ class DataCatalogTree(TreeView):
         Insert new grass db into model, update user setting and refresh tree.
         Check if not already added.
         """
-        grassdb_node = self._model.SearchNodes(name=name, type="grassdb")
+        grassdb_node = self._model.SearchNodes(
+            name=name, type="grassdb", recursive=False
+        )
         if not grassdb_node:
             grassdb_node = self._model.AppendNode(
                 parent=self._model.root, data=dict(type="grassdb", name=name)
@@ -1851,8 +1907,15 @@ class DataCatalogTree(TreeView):
         Switch to location and mapset interactively.
         Returns True if switching is successful.
         """
+        genv = gisenv()
+        # Nothing to do when the target mapset is already the current one
+        if (
+            grassdb == genv["GISDBASE"]
+            and location == genv["LOCATION_NAME"]
+            and mapset == genv["MAPSET"]
+        ):
+            return True
         if can_switch_mapset_interactive(self, grassdb, location, mapset):
-            genv = gisenv()
             # Switch to mapset in the same location
             if grassdb == genv["GISDBASE"] and location == genv["LOCATION_NAME"]:
                 switch_mapset_interactively(
@@ -1888,11 +1951,22 @@ class DataCatalogTree(TreeView):
                 if node:
                     self.InsertMapset(name=mapset, location_node=node)
             elif action == "delete":
-                node = self.GetDbNode(grassdb=grassdb, location=location)
+                node = self.GetDbNode(grassdb=grassdb, location=location, mapset=mapset)
                 if node:
-                    self._reloadLocationNode(node)
+                    location_node = node.parent
+                    self._model.RemoveNode(node)
+                    if self._orig_model is not self._model:
+                        # keep the model backing Filter in sync, otherwise
+                        # filtering would resurrect the deleted mapset
+                        # (cloned nodes share the data dictionaries)
+                        for orig_node in self._orig_model.SearchNodes(
+                            name=mapset, type="mapset"
+                        ):
+                            if orig_node.data is node.data:
+                                self._orig_model.RemoveNode(orig_node)
+                                break
                     self.UpdateCurrentDbLocationMapsetNode()
-                    self.RefreshNode(node, recursive=True)
+                    self.RefreshNode(location_node, recursive=True)
             elif action == "rename":
                 node = self.GetDbNode(grassdb=grassdb, location=location, mapset=mapset)
                 if node:
@@ -1940,7 +2014,7 @@ class DataCatalogTree(TreeView):
                             self.RefreshNode(node.parent, recursive=True)
                         # check if map already exists
                         elif not self._model.SearchNodes(
-                            parent=node, name=map, type=element
+                            parent=node, name=map, type=element, recursive=False
                         ):
                             self.InsertLayer(
                                 name=map, mapset_node=node, element_name=element
@@ -2049,7 +2123,7 @@ class DataCatalogTree(TreeView):
         self.UpdateCurrentDbLocationMapsetNode()
         self.RefreshItems()
         self.ExpandCurrentMapset()
-        if self._model.GetLeafCount(self._model.root) <= 50:
+        if self._model.GetLeafCount(self._model.root, limit=50) <= 50:
             self.ExpandAll()
 
     def OnReloadMapset(self, event):
@@ -2105,10 +2179,12 @@ class DataCatalogTree(TreeView):
 
     def _confirmDialog(self, question, title):
         """Confirm dialog"""
-        dlg = wx.MessageDialog(self, question, title, wx.YES_NO)
-        res = dlg.ShowModal()
-        dlg.Destroy()
-        return res
+        if self._confirmDlg is None:
+            self._confirmDlg = wx.MessageDialog(self, question, title, wx.YES_NO)
+        else:
+            self._confirmDlg.SetMessage(question)
+            self._confirmDlg.SetTitle(title)
+        return self._confirmDlg.ShowModal()
 
     def _isCurrent(self, genv):
         if self._restricted:
@@ -1207,12 +1207,14 @@ class GroupDialog(wx.Dialog):
             flt_data = data[:]
             return flt_data
 
+        try:
+            pattern = re.compile(self.flt_pattern)
+        except re.error:
+            return flt_data
+
         for dt in data:
-            try:
-                if re.compile(self.flt_pattern).search(dt):
-                    flt_data.append(dt)
-            except:
-                pass
+            if pattern.search(dt):
+                flt_data.append(dt)
 
         return flt_data
 
@@ -1653,12 +1655,14 @@ class MapLayersDialogBase(wx.Dialog):
             return
 
         list = []
-        for layer in self.map_layers:
-            try:
-                if re.compile(event.GetString()).search(layer):
+        try:
+            pattern = re.compile(event.GetString())
+        except re.error:
+            pattern = None
+        if pattern:
+            for layer in self.map_layers:
+                if pattern.search(layer):
                     list.append(layer)
-            except:
-                pass
         list = naturally_sorted(list)
 
         self.layers.Set(list)
@@ -50,7 +50,7 @@ if __name__ == "__main__":
 from core import globalvar
 from core.gcmd import GError, DecodeString
 from gui_core.widgets import FormNotebook, ScrolledPanel
-from gui_core.wrap import Button, StaticText, TextCtrl
+from gui_core.wrap import Button, ListCtrl, StaticText, TextCtrl
 from core.debug import Debug
 
 
@@ -138,103 +138,70 @@ class AboutWindow(wx.Frame):
         team = StaticText(parent=infoTxt, label=_grassDevTeam(1999) + "\n")
         infoSizer.Add(team, proportion=0, flag=wx.BOTTOM | wx.ALIGN_CENTER, border=1)
 
-        row = 0
-        infoGridSizer.Add(
-            StaticText(parent=infoTxt, id=wx.ID_ANY, label=_("Official GRASS site:")),
-            pos=(row, 0),
-            flag=wx.ALIGN_RIGHT,
-        )
+        def _addInfoRow(row, label, value):
+            """Add a label and a value widget as one row of the grid"""
+            infoGridSizer.Add(
+                StaticText(parent=infoTxt, id=wx.ID_ANY, label=label),
+                pos=(row, 0),
+                flag=wx.ALIGN_RIGHT,
+            )
+            infoGridSizer.Add(value, pos=(row, 1), flag=wx.ALIGN_LEFT)
 
-        infoGridSizer.Add(
+        row = 0
+        _addInfoRow(
+            row,
+            _("Official GRASS site:"),
             HyperLinkCtrl(
                 parent=infoTxt, id=wx.ID_ANY, label="https://grass.osgeo.org"
             ),
-            pos=(row, 1),
-            flag=wx.ALIGN_LEFT,
         )
 
         row += 2
-        infoGridSizer.Add(
-            StaticText(parent=infoTxt, id=wx.ID_ANY, label="%s:" % _("Code Revision")),
-            pos=(row, 0),
-            flag=wx.ALIGN_RIGHT,
-        )
-
-        infoGridSizer.Add(
+        _addInfoRow(
+            row,
+            "%s:" % _("Code Revision"),
             HyperLinkCtrl(
                 parent=infoTxt,
                 id=wx.ID_ANY,
                 label=vInfo.get("revision", "?"),
                 URL="https://github.com/OSGeo/grass.git",
             ),
-            pos=(row, 1),
-            flag=wx.ALIGN_LEFT,
         )
 
         row += 1
-        infoGridSizer.Add(
-            StaticText(parent=infoTxt, id=wx.ID_ANY, label="%s:" % _("Build Date")),
-            pos=(row, 0),
-            flag=wx.ALIGN_RIGHT,
-        )
-
-        infoGridSizer.Add(
+        _addInfoRow(
+            row,
+            "%s:" % _("Build Date"),
             StaticText(
                 parent=infoTxt, id=wx.ID_ANY, label=vInfo.get("build_date", "?")
             ),
-            pos=(row, 1),
-            flag=wx.ALIGN_LEFT,
         )
 
         # show only basic info
         # row += 1
-        # infoGridSizer.Add(item = wx.StaticText(parent = infoTxt, id = wx.ID_ANY,
-        #                                        label = '%s:' % _('GIS Library Revision')),
-        #                   pos = (row, 0),
-        #                   flag = wx.ALIGN_RIGHT)
-
-        # infoGridSizer.Add(item = wx.StaticText(parent = infoTxt, id = wx.ID_ANY,
-        #                                        label = vInfo['libgis_revision'] + ' (' +
-        #                                        vInfo['libgis_date'].split(' ')[0] + ')'),
-        #                   pos = (row, 1),
-        #                   flag = wx.ALIGN_LEFT)
+        # _addInfoRow(row, '%s:' % _('GIS Library Revision'),
+        #             wx.StaticText(parent = infoTxt, id = wx.ID_ANY,
+        #                           label = vInfo['libgis_revision'] + ' (' +
+        #                           vInfo['libgis_date'].split(' ')[0] + ')'))
 
         row += 2
-        infoGridSizer.Add(
-            StaticText(parent=infoTxt, id=wx.ID_ANY, label="Python:"),
-            pos=(row, 0),
-            flag=wx.ALIGN_RIGHT,
-        )
-
-        infoGridSizer.Add(
+        _addInfoRow(
+            row,
+            "Python:",
             StaticText(parent=infoTxt, id=wx.ID_ANY, label=platform.python_version()),
-            pos=(row, 1),
-            flag=wx.ALIGN_LEFT,
         )
 
         row += 1
-        infoGridSizer.Add(
-            StaticText(parent=infoTxt, id=wx.ID_ANY, label="wxPython:"),
-            pos=(row, 0),
-            flag=wx.ALIGN_RIGHT,
-        )
-
-        infoGridSizer.Add(
+        _addInfoRow(
+            row,
+            "wxPython:",
             StaticText(parent=infoTxt, id=wx.ID_ANY, label=wx.__version__),
-            pos=(row, 1),
-            flag=wx.ALIGN_LEFT,
         )
 
         infoGridSizer.AddGrowableCol(0)
         infoGridSizer.AddGrowableCol(1)
         infoSizer.Add(infoGridSizer, proportion=1, flag=wx.EXPAND)
 
-        row += 2
-        infoGridSizer.Add(
-            StaticText(parent=infoTxt, id=wx.ID_ANY, label="%s:" % _("Language")),
-            pos=(row, 0),
-            flag=wx.ALIGN_RIGHT,
-        )
         self.langUsed = grass.gisenv().get("LANG", None)
         if not self.langUsed:
             import locale
@@ -244,10 +211,11 @@ class AboutWindow(wx.Frame):
                 self.langUsed = _("unknown")
             else:
                 self.langUsed = "%s.%s" % (loc[0], loc[1])
-        infoGridSizer.Add(
+        row += 2
+        _addInfoRow(
+            row,
+            "%s:" % _("Language"),
             StaticText(parent=infoTxt, id=wx.ID_ANY, label=self.langUsed),
-            pos=(row, 1),
-            flag=wx.ALIGN_LEFT,
         )
 
         infoTxt.SetSizer(infoSizer)
@@ -427,18 +395,21 @@ class AboutWindow(wx.Frame):
                 items = (_("Name"), _("E-mail"), _("Country"))
             else:
                 items = (_("Name"), _("E-mail"), _("Country"), _("OSGeo_ID"))
-            contribBox = wx.FlexGridSizer(cols=len(items), vgap=5, hgap=5)
-            for item in items:
-                text = StaticText(parent=contribwin, id=wx.ID_ANY, label=item)
-                text.SetFont(wx.Font(10, wx.DEFAULT, wx.NORMAL, wx.BOLD, 0, ""))
-                contribBox.Add(text)
+            # single list control instead of a grid of static texts,
+            # the contributors list has hundreds of rows
+            contribList = ListCtrl(
+                parent=contribwin, id=wx.ID_ANY, style=wx.LC_REPORT | wx.BORDER_NONE
+            )
+            for i, item in enumerate(items):
+                contribList.InsertColumn(i, item)
             for vals in sorted(contribs, key=lambda x: x[0]):
-                for item in vals:
-                    contribBox.Add(
-                        StaticText(parent=contribwin, id=wx.ID_ANY, label=item)
-                    )
+                index = contribList.InsertItem(contribList.GetItemCount(), vals[0])
+                for i, item in enumerate(vals[1:], start=1):
+                    contribList.SetItem(index, i, item)
+            for i in range(len(items)):
+                contribList.SetColumnWidth(i, wx.LIST_AUTOSIZE)
             contribwin.sizer.Add(
-                contribBox, proportion=1, flag=wx.EXPAND | wx.ALL, border=3
+                contribList, proportion=1, flag=wx.EXPAND | wx.ALL, border=3
             )
 
         contribwin.SetSizer(contribwin.sizer)
@@ -33,6 +33,7 @@ from grass.pydispatch.signal import Signal
 from core import globalvar
 from core import utils
 from core.gcmd import EncodeString, DecodeString
+from core.gthread import gThread
 
 
 class GPrompt(object):
@@ -52,6 +53,8 @@ class GPrompt(object):
 
         # probably only subclasses need this
         self._menuModel = menuModel
+        # command -> description mapping built from the menu model on demand
+        self._menuModelDescs = None
 
         self.mapList = self._getListOfMaps()
         self.mapsetList = utils.ListOfMapsets()
@@ -63,6 +66,8 @@ class GPrompt(object):
         # command description (gtask.grassTask)
         self.cmdDesc = None
 
+        # cached history file content as (path, mtime, list of commands)
+        self._historyCache = None
         self._loadHistory()
         if giface:
             giface.currentMapsetChanged.connect(self._loadHistory)
@@ -71,22 +76,34 @@ class GPrompt(object):
         self.commands = list()
 
         # reload map lists when needed
+        self._threadReloadMaps = gThread()
         if giface:
             giface.currentMapsetChanged.connect(self._reloadListOfMaps)
             giface.grassdbChanged.connect(self._reloadListOfMaps)
 
     def _readHistory(self):
-        """Get list of commands from history file"""
+        """Get list of commands from history file.
+
+        The file content is cached, so the file is re-read
+        only when it has changed since the last read."""
         hist = list()
         env = grass.gisenv()
+        filePath = os.path.join(
+            env["GISDBASE"],
+            env["LOCATION_NAME"],
+            env["MAPSET"],
+            ".bash_history",
+        )
+        try:
+            mtime = os.path.getmtime(filePath)
+        except OSError:
+            return hist
+        if self._historyCache and self._historyCache[:2] == (filePath, mtime):
+            return list(self._historyCache[2])
+
         try:
             fileHistory = codecs.open(
-                os.path.join(
-                    env["GISDBASE"],
-                    env["LOCATION_NAME"],
-                    env["MAPSET"],
-                    ".bash_history",
-                ),
+                filePath,
                 encoding="utf-8",
                 mode="r",
                 errors="replace",
@@ -100,6 +117,7 @@ class GPrompt(object):
         finally:
             fileHistory.close()
 
+        self._historyCache = (filePath, mtime, list(hist))
         return hist
 
     def _loadHistory(self):
@@ -107,6 +125,29 @@ class GPrompt(object):
         self.cmdbuffer = self._readHistory()
         self.cmdindex = len(self.cmdbuffer)
 
+    def _getCommandDescription(self, command):
+        """Get description of a command from the menu model.
+
+        The mapping of commands to descriptions is built from the menu
+        model on the first call, so the model is searched only once
+        instead of being walked on every lookup.
+
+        :param command: command given as a string
+
+        :return: description or None if command is not in the menu model
+        """
+        if self._menuModelDescs is None:
+            self._menuModelDescs = {}
+            nodes = [self._menuModel.root]
+            while nodes:
+                node = nodes.pop()
+                nodes.extend(node.children)
+                if node.data and "command" in node.data:
+                    self._menuModelDescs[node.data["command"]] = node.data.get(
+                        "description", ""
+                    )
+        return self._menuModelDescs.get(command)
+
     def _getListOfMaps(self):
         """Get list of maps"""
         result = dict()
@@ -116,7 +157,13 @@ class GPrompt(object):
         return result
 
     def _reloadListOfMaps(self):
-        self.mapList = self._getListOfMaps()
+        """Reload list of maps in a separate thread
+        to avoid blocking the GUI."""
+
+        def _done(event):
+            self.mapList = event.ret
+
+        self._threadReloadMaps.Run(callable=self._getListOfMaps, ondone=_done)
 
     def _runCmd(self, cmdString):
         """Run command
@@ -229,14 +276,11 @@ class GPromptSTC(GPrompt, wx.stc.StyledTextCtrl):
                 + "."
                 + self.autoCompList[event.GetIndex()]
             )
-            try:
-                nodes = self._menuModel.SearchNodes(key="command", value=item)
-                desc = ""
-                if nodes:
-                    self.commandSelected.emit(command=item)
-                    desc = nodes[0].data["description"]
-            except KeyError:
+            desc = self._getCommandDescription(item)
+            if desc is None:
                 desc = ""
+            else:
+                self.commandSelected.emit(command=item)
             self.ShowStatusText(desc)
         # list of flags
         elif self.toComplete["entity"] == "flags":
@@ -491,10 +535,10 @@ class GPromptSTC(GPrompt, wx.stc.StyledTextCtrl):
             self.toComplete = self.EntityToComplete()
             try:
                 if self.toComplete["entity"] == "command":
+                    dotNumber = self.toComplete["cmd"].count(".")
                     for command in globalvar.grassCmd:
                         try:
                             if command.find(self.toComplete["cmd"]) == 0:
-                                dotNumber = list(self.toComplete["cmd"]).count(".")
                                 self.autoCompList.append(
                                     command.split(".", dotNumber)[-1]
                                 )
@@ -562,9 +606,9 @@ class GPromptSTC(GPrompt, wx.stc.StyledTextCtrl):
 
             # complete command
             if self.toComplete["entity"] == "command":
+                dotNumber = self.toComplete["cmd"].count(".")
                 for command in globalvar.grassCmd:
                     if command.find(self.toComplete["cmd"]) == 0:
-                        dotNumber = list(self.toComplete["cmd"]).count(".")
                         self.autoCompList.append(command.split(".", dotNumber)[-1])
 
             # complete flags in such situations (| is cursor):
@@ -38,10 +38,16 @@ def get_possible_database_path():
 
     # find possible database path
     for candidate in candidates:
-        if os.path.exists(candidate):
-            for subdir in next(os.walk(candidate))[1]:
-                if "grassdata" in subdir.lower():
-                    return os.path.join(candidate, subdir)
+        try:
+            with os.scandir(candidate) as entries:
+                for entry in entries:
+                    if (
+                        entry.is_dir(follow_symlinks=False)
+                        and "grassdata" in entry.name.lower()
+                    ):
+                        return os.path.join(candidate, entry.name)
+        except OSError:
+            continue
     return None
 
 
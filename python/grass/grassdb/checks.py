@@ -10,6 +10,7 @@ for details.
 """
 
 import os
+import stat
 import sys
 import datetime
 from pathlib import Path
@@ -160,8 +161,11 @@ def get_lockfile_if_present(database, location, mapset):
     """
     lock_name = ".gislock"
     lockfile = os.path.join(database, location, mapset, lock_name)
-    if os.path.isfile(lockfile):
-        return lockfile
+    try:
+        if stat.S_ISREG(os.stat(lockfile).st_mode):
+            return lockfile
+    except OSError:
+        pass
     return None
 
 
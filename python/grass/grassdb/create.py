@@ -11,7 +11,6 @@ for details.
 
 
 import os
-import shutil
 import getpass
 
 
@@ -21,11 +20,13 @@ def create_mapset(database, location, mapset):
     mapset_path = os.path.join(location_path, mapset)
     # create an empty directory
     os.mkdir(mapset_path)
-    # copy DEFAULT_WIND file and its permissions from PERMANENT
-    # to WIND in the new mapset
+    # copy DEFAULT_WIND file from PERMANENT to WIND in the new mapset
+    # (the file is tiny, a single read/write is cheaper than shutil.copy
+    # which adds a stat round trip for copying permissions)
     region_path1 = os.path.join(location_path, "PERMANENT", "DEFAULT_WIND")
     region_path2 = os.path.join(location_path, mapset, "WIND")
-    shutil.copy(region_path1, region_path2)
+    with open(region_path1, "rb") as source, open(region_path2, "wb") as target:
+        target.write(source.read())
     # set permissions to u+rw,go+r (disabled; why?)
     # os.chmod(os.path.join(database,location,mapset,'WIND'), 0644)
 
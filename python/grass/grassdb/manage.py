@@ -12,6 +12,29 @@ for details.
 
 import os
 import shutil
+import subprocess
+
+
+def _remove_tree(path):
+    """Remove a directory tree.
+
+    On POSIX systems the system rm is used since it removes
+    directories with many small files (typical for mapsets)
+    considerably faster than shutil.rmtree.
+
+    Raises OSError on failure like shutil.rmtree does,
+    including FileNotFoundError for a non-existent path.
+    """
+    if os.name == "posix":
+        # raises FileNotFoundError for a missing path
+        # (rm -rf would silently succeed)
+        os.lstat(path)
+        process = subprocess.run(["rm", "-rf", "--", path], stderr=subprocess.PIPE)
+        if process.returncode != 0:
+            # callers expect an OSError as raised by shutil.rmtree
+            raise OSError(process.stderr.decode(errors="replace").strip())
+    else:
+        shutil.rmtree(path)
 
 
 def delete_mapset(database, location, mapset):
@@ -20,17 +43,17 @@ def delete_mapset(database, location, mapset):
         raise ValueError(
             _("Mapset PERMANENT cannot be deleted (a whole location can be)")
         )
-    shutil.rmtree(os.path.join(database, location, mapset))
+    _remove_tree(os.path.join(database, location, mapset))
 
 
 def delete_location(database, location):
     """Deletes a specified location"""
-    shutil.rmtree(os.path.join(database, location))
+    _remove_tree(os.path.join(database, location))
 
 
 def delete_grassdb(database):
     """Deletes a specified GRASS database"""
-    shutil.rmtree(database)
+    _remove_tree(database)
 
 
 def rename_mapset(database, location, old_name, new_name):
@@ -67,7 +67,6 @@
 # % description: Process bands serially (default: run in parallel)
 # %end
 
-import sys
 import multiprocessing as mp
 
 import grass.script as gscript
@@ -81,8 +80,9 @@ def get_percentile(map, percentiles):
 
     s = gscript.read_command("r.quantile", input=map, percentiles=values, quiet=True)
 
-    val_str1 = s.splitlines()[0].split(":")[2]
-    val_str2 = s.splitlines()[1].split(":")[2]
+    lines = s.splitlines()
+    val_str1 = lines[0].split(":")[2]
+    val_str2 = lines[1].split(":")[2]
     return (float(val_str1), float(val_str2))
 
 
@@ -137,12 +137,12 @@ def main():
     if full:
         for i in [red, green, blue]:
             gscript.run_command("r.colors", map=i, color="grey", quiet=True)
-        sys.exit(0)
+        return
 
     if reset:
         for i in [red, green, blue]:
             gscript.run_command("r.colors", map=i, color="grey255", quiet=True)
-        sys.exit(0)
+        return
 
     if not preserve:
         if do_mp:
@@ -180,8 +180,8 @@ def main():
                 set_colors(i, v0, v1)
 
     else:
-        all_max = 0
-        all_min = 999999
+        all_max = float("-inf")
+        all_min = float("inf")
 
         if do_mp:
             gscript.message(_("Processing..."))